@@ -1,46 +1,73 @@
 """Main module."""
 
+import sys
+
 import handler
+from models import ContactError, PhoneFormatError
+
+# Command table: name -> (handler, expected number of arguments, usage message).
+# Handler None ends the session; arity None accepts any arguments.
+_COMMANDS = {
+    "hello": (lambda *_: "How can I help you?", None, None),
+    "all": (lambda *_: handler.get_all_contacts(), None, None),
+    "add": (handler.add_contact_number, 2,
+            "Invalid command. Usage: add [ім'я] [номер телефону]"),
+    "change": (handler.change_contact_number, 3,
+               "Invalid command. Usage: change [ім'я] [номер телефону] [новий номер телефону]"),
+    "contact": (handler.get_contact, 1, "Invalid command. Usage: contact [ім'я]"),
+    "delete": (handler.delete_contact, 1, "Invalid command. Usage: delete [ім'я]"),
+    "exit": (None, None, None),
+    "close": (None, None, None),
+}
 
 def parse_input(user_input: str) -> tuple:
     """Parses user input and returns command and arguments."""
     cmd, *args = user_input.split()
-    cmd = cmd.strip().lower()
+    cmd = sys.intern(cmd.lower())
     return cmd, *args
 
-def main():
-    """Main function."""
-    print("Welcome to the assistant bot!")
+def read_commands():
+    """Yields raw command lines, prompting only when stdin is interactive."""
+    if not sys.stdin.isatty():
+        yield from sys.stdin
+        return
 
     while True:
-        user_input = input("Enter a command: ")
-        command, *args = parse_input(user_input)
-
-        if command == "hello":
-            print("How can I help you?")
+        try:
+            yield input("Enter a command: ")
+        except EOFError:
+            return
 
-        elif command == "all":
-            print(handler.get_all_contacts())
-
-        elif command == "add":
-            print(handler.add_contact_number(*args))
+def main():
+    """Main function."""
+    print("Welcome to the assistant bot!")
 
-        elif command == "change":
-            print(handler.change_contact_number(*args))
+    for user_input in read_commands():
+        if not user_input.strip():
+            continue
 
-        elif command == "contact":
-            print(handler.get_contact(*args))
+        command, *args = parse_input(user_input)
 
-        elif command == "delete":
-            print(handler.delete_contact(*args))
+        entry = _COMMANDS.get(command)
+        if entry is None:
+            print("Invalid command. Usage: hello | all | add [name] [phone] | "\
+                  "change [name] [phone] | contact [name] | delete [name] | exit | close")
+            continue
 
-        elif command in ["exit", "close"]:
+        func, arity, usage = entry
+        if func is None:
             print("Goodbye!")
             break
 
-        else:
-            print("Invalid command. Usage: hello | all | add [name] [phone] | "\
-                  "change [name] [phone] | contact [name] | delete [name] | exit | close")
+        if arity is not None and len(args) != arity:
+            print(usage)
+            continue
+
+        try:
+            print(func(*args))
+        except (ContactError, PhoneFormatError) as e:
+            prefix = usage + "\n" if usage else ""
+            print(f"{prefix}Error: {e}")
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,23 @@
 """Module that contains classes for working with address book."""
 
-import re
+import sys
 
 from collections import UserDict
 
+class _PhoneCharsTable(dict):
+    """Translation table that also deletes characters above U+00FF, which have no entry."""
+    def __missing__(self, key: int) -> None:
+        return None
+
+_PHONE_KEEP = "+0123456789"
+_PHONE_DELETE = _PhoneCharsTable(
+    str.maketrans("", "", "".join(chr(c) for c in range(256) if chr(c) not in _PHONE_KEEP))
+)
+_PHONE_DELETE.update((ord(c), ord(c)) for c in _PHONE_KEEP)
+
+_COUNTRY_CODE = "38"
+_COUNTRY_PREFIX = "+" + _COUNTRY_CODE
+
 class Field:
     """
     Represents a base field object.
@@ -14,21 +28,14 @@ class Field:
     Attributes:
         value (any): The value of the field.
     """
+    __slots__ = ("value",)
+
     def __init__(self, value: any) -> None:
         self.value = value
 
     def __str__(self) -> str:
         return str(self.value)
 
-    def __eq__(self, other) -> bool:
-        if not isinstance(other, Field):
-            return False
-
-        return self.value == other.value
-
-    def __hash__(self):
-        return hash(self.value)
-
 class Name(Field):
     """
     Represents a name field.
@@ -39,6 +46,8 @@ class Name(Field):
     Attributes:
         name (str): The name field.
     """
+    __slots__ = ()
+
     def __init__(self, name: str) -> None:
         super().__init__(name)
 
@@ -55,100 +64,123 @@ class Phone(Field):
     Raises:
         PhoneFormatError: If the phone number format is not valid.
     """
-    pattern = r"[+\d]"
-    country_code = "38"
+    __slots__ = ()
 
     def __init__(self, raw_phone: str) -> None:
 
-        phone = "".join(re.findall(self.pattern, raw_phone))
+        # Already normalized (e.g. a value taken from an existing Phone).
+        if len(raw_phone) == 13 and raw_phone.startswith(_COUNTRY_PREFIX) \
+                and raw_phone.isascii() and raw_phone[1:].isdigit():
+            super().__init__(sys.intern(raw_phone))
+            return
+
+        # Ten digits is the shortest input that can normalize to a valid number.
+        if len(raw_phone) < 10:
+            raise PhoneFormatError("Invalid phone number.")
+
+        phone = raw_phone.translate(_PHONE_DELETE)
 
         if not phone.startswith("+"):
-            phone = re.sub(fr"^({self.country_code})?", f"+{self.country_code}", phone)
+            if phone.startswith(_COUNTRY_CODE):
+                phone = "+" + phone
+            else:
+                phone = _COUNTRY_PREFIX + phone
 
         if len(phone) != 13:
             raise PhoneFormatError("Invalid phone number.")
 
-        super().__init__(phone)
+        super().__init__(sys.intern(phone))
 
 class Record:
     """
-    Represents a contact record with a name and a list of phone numbers.
+    Represents a contact record with a name and phone numbers keyed by normalized value.
 
     Args:
         name (str): The name of the contact.
 
     Attributes:
         name (Name): The name of the contact.
-        phones (list): A list of phone numbers associated with the contact.
+        phones (dict): Phone numbers associated with the contact, keyed by normalized value.
+
+    The string form of the record is cached. Change phones only through add_phone,
+    remove_phone and edit_phone, and do not reassign name, or str() will return stale output.
     """
+    __slots__ = ("name", "phones", "_str_cache")
 
     def __init__(self, name: str):
         self.name = Name(name)
-        self.phones = []
+        self.phones: dict[str, Phone] = {}
+        self._str_cache = None
 
-    def add_phone(self, phone: str):
+    def add_phone(self, phone: str | Phone):
         """
-        Adds a phone number to the contact's list of phone numbers.
+        Adds a phone number to the contact's phone numbers.
 
         Args:
-            phone (Phone): The phone number to add.
+            phone (str | Phone): The phone number to add. A Phone is stored as is.
 
         Raises:
-            ContactError: If the phone number already exists in the contact's list of phone numbers.
+            ContactError: If the phone number already exists in the contact's phone numbers.
         """
-        if self.find_phone(phone):
+        new_phone = phone if isinstance(phone, Phone) else Phone(phone)
+        if new_phone.value in self.phones:
             raise ContactError("Phone number already exists.")
 
-        self.phones.append(Phone(phone))
+        self.phones[new_phone.value] = new_phone
+        self._str_cache = None
 
     def remove_phone(self, phone: str):
         """
-        Removes a phone number from the contact's list of phone numbers.
+        Removes a phone number from the contact's phone numbers.
         Won't raise error if phone number not exist.
 
         Args:
             phone (str): The phone number to remove.
         """
-        existing_phone = self.find_phone(phone)
-        if existing_phone:
-            self.phones.remove(existing_phone)
+        if self.phones.pop(Phone(phone).value, None):
+            self._str_cache = None
 
     def edit_phone(self, phone: str, new_phone: str):
         """
-        Edits a phone number in the contact's list of phone numbers.
+        Edits a phone number in the contact's phone numbers.
 
         Args:
             phone (str): The phone number to edit.
             new_phone (str): The new phone number.
 
         Raises:
-            ContactError: If the phone number to edit does not exist in the contact's phones list,
-                        or if the new phone number already exists in the contact's phones list.
+            ContactError: If the phone number to edit does not exist in the contact's phone numbers,
+                        or if the new phone number already exists in the contact's phone numbers.
         """
-        existing_phone = self.find_phone(phone)
-        if not existing_phone:
+        existing_value = Phone(phone).value
+        if existing_value not in self.phones:
             raise ContactError("No such phone number.")
 
-        if self.find_phone(new_phone):
+        replacement = Phone(new_phone)
+        if replacement.value in self.phones:
             raise ContactError("New phone number already exists.")
 
-        self.phones[self.phones.index(existing_phone)] = Phone(new_phone)
+        del self.phones[existing_value]
+        self.phones[replacement.value] = replacement
+        self._str_cache = None
 
     def find_phone(self, phone: str) -> Phone | None:
         """
-        Finds a phone number in the contact's list of phone numbers.
+        Finds a phone number in the contact's phone numbers.
 
         Args:
-            phone (str): The phone number to check.
+            phone (str): The phone number to check, normalized before the lookup.
 
         Returns:
             Phone: The phone number if found, None otherwise.
         """
-        target_phone = Phone(phone)
-        return next((p for p in self.phones if p == target_phone), None)
+        return self.phones.get(Phone(phone).value)
 
     def __str__(self):
-        return f"Contact name: {self.name.value}, phones: {'; '.join(p.value for p in self.phones)}"
+        s = self._str_cache
+        if s is None:
+            s = self._str_cache = f"Contact name: {self.name.value}, phones: {'; '.join(self.phones)}"
+        return s
 
 class AddressBook(UserDict):
     """
@@ -157,12 +189,14 @@ class AddressBook(UserDict):
     This class extends the UserDict class to provide functionality for managing contacts in an address book.
 
     Attributes:
-        data (dict): A dictionary to store the contacts in the address book.
+        data (dict): A dictionary to store the contacts in the address book, keyed by name.
 
     Methods:
         add_record(record: Record): Adds a record to the address book.
-        find(name: Name) -> Record: Finds a record in the address book by name.
-        delete(name: Name): Deletes a record from the address book by name.
+        find(name: str) -> Record: Finds a record in the address book by name.
+        get_or_create(name: str) -> Record: Finds a record by name, adding a new one if missing.
+        add_phone(name: str, phone: str): Adds a phone number to a contact, creating the contact if missing.
+        delete(name: str): Deletes a record from the address book by name.
     """
 
     def add_record(self, record: Record) -> None:
@@ -175,10 +209,11 @@ class AddressBook(UserDict):
         Raises:
             ContactError: If the contact already exists in the data dictionary.
         """
-        if record.name in self.data:
+        key = record.name.value
+        if key in self.data:
             raise ContactError("Contact already exists.")
 
-        self.data[record.name] = record
+        self.data[key] = record
 
     def find(self, name: str, raise_error: bool = True) -> Record | None:
         """
@@ -195,14 +230,43 @@ class AddressBook(UserDict):
         Raises:
             ContactError: If no contact with the given name is found. Only if raise_error is True.
         """
-        name = Name(name)
+        record = self.data.get(name)
+        if record is None and raise_error:
+            raise ContactError("No such contact.")
 
-        if name not in self.data:
-            if raise_error:
-                raise ContactError("No such contact.")
-            return None
+        return record
 
-        return self.data[name]
+    def get_or_create(self, name: str) -> Record:
+        """
+        Find a contact by name, creating an empty one if it does not exist.
+
+        Args:
+            name (str): The name of the contact.
+
+        Returns:
+            Record: The existing or newly added contact record.
+        """
+        record = self.data.get(name)
+        if record is None:
+            record = self.data[name] = Record(name)
+
+        return record
+
+    def add_phone(self, name: str, phone: str) -> None:
+        """
+        Adds a phone number to a contact, creating the contact if it does not exist.
+        The phone is validated first, so an invalid number never creates an empty contact.
+
+        Args:
+            name (str): The name of the contact.
+            phone (str): The phone number to add.
+
+        Raises:
+            PhoneFormatError: If the phone number format is not valid.
+            ContactError: If the contact already has this phone number.
+        """
+        new_phone = Phone(phone)
+        self.get_or_create(name).add_phone(new_phone)
 
     def delete(self, name: str):
         """
@@ -212,19 +276,10 @@ class AddressBook(UserDict):
         Args:
             name (str): The name to be deleted.
         """
-        name = Name(name)
-
-        if name in self.data:
-            del self.data[name]
+        self.data.pop(name, None)
 
 class ContactError(Exception):
     """Custom exception for contact errors."""
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
 
 class PhoneFormatError(Exception):
     """Custom exception for phone number format errors."""
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)